@@ -0,0 +1,92 @@
+"""On-disk response cache for council deliberations."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Cache directory for stored responses
+CACHE_DIR = Path.home() / ".cache" / "llm-council"
+
+# Time-to-live for cache entries in seconds (default: 24 hours).
+# Set to 0 or a negative value to keep entries forever.
+CACHE_TTL = float(os.getenv("LLM_COUNCIL_CACHE_TTL", "86400"))
+
+
+def cache_key(
+    question: str,
+    council_models: List[str],
+    chairman_model: Optional[str] = None,
+    namespace: str = "council_query"
+) -> str:
+    """
+    Compute a deterministic cache key for a council request.
+
+    Args:
+        question: The user's question
+        council_models: List of OpenRouter model identifiers
+        chairman_model: Chairman model identifier (None for stage1-only requests)
+        namespace: Key namespace to separate different tool caches
+
+    Returns:
+        Short hex digest identifying this request
+    """
+    payload = {
+        "namespace": namespace,
+        "question": question,
+        "council_models": list(council_models),
+        "chairman_model": chairman_model,
+    }
+    serialized = json.dumps(payload, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+
+
+def get_cached_response(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached response if present and not expired.
+
+    Args:
+        key: Cache key from cache_key()
+
+    Returns:
+        Cached response dict, or None on miss or expiry
+    """
+    path = CACHE_DIR / f"{key}.json"
+
+    if not path.exists():
+        return None
+
+    # Expire entries based on file modification time
+    if CACHE_TTL > 0 and time.time() - path.stat().st_mtime > CACHE_TTL:
+        return None
+
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        # Treat unreadable/corrupt entries as misses
+        return None
+
+
+def set_cached_response(key: str, response: Dict[str, Any]):
+    """
+    Store a response in the cache.
+
+    A failed write (unwritable cache dir, disk full) is silently
+    dropped: caching is an optimization and must never fail a
+    completed deliberation.
+
+    Args:
+        key: Cache key from cache_key()
+        response: Full response dict to store
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+        path = CACHE_DIR / f"{key}.json"
+        with open(path, 'w') as f:
+            json.dump(response, f)
+    except OSError:
+        pass
@@ -1,16 +1,57 @@
 """3-stage LLM Council orchestration."""
 
-from typing import List, Dict, Any, Tuple
+import asyncio
+import functools
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from .openrouter import query_models_parallel, query_model
 from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
 
 
-async def stage1_collect_responses(user_query: str) -> List[Dict[str, Any]]:
+class CouncilError(Exception):
+    """
+    Raised when a council stage fails unexpectedly.
+
+    Per-model API failures degrade gracefully (failed models are simply
+    dropped); this covers everything else, so handlers can report which
+    stage broke without exposing a full traceback.
+    """
+
+    def __init__(self, stage: int, cause: Exception):
+        super().__init__(f"Stage {stage} failed: {cause}")
+        self.stage = stage
+        self.cause = cause
+
+
+def _council_stage(stage: int):
+    """Wrap a stage coroutine so unexpected failures raise CouncilError."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except CouncilError:
+                raise
+            except Exception as e:
+                raise CouncilError(stage, e) from e
+        return wrapper
+    return decorator
+
+
+@_council_stage(1)
+async def stage1_collect_responses(
+    user_query: str,
+    on_model_complete: Optional[Callable[[str, Optional[Dict[str, Any]]], Awaitable[None]]] = None,
+    council_models: List[str] = COUNCIL_MODELS
+) -> List[Dict[str, Any]]:
     """
     Stage 1: Collect individual responses from all council models.
 
     Args:
         user_query: The user's question
+        on_model_complete: Optional async callback invoked with
+            (model, response) as each model finishes
+        council_models: OpenRouter model identifiers to query
 
     Returns:
         List of dicts with 'model' and 'response' keys
@@ -18,7 +59,19 @@ async def stage1_collect_responses(user_query: str) -> List[Dict[str, Any]]:
     messages = [{"role": "user", "content": user_query}]
 
     # Query all models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
+    if on_model_complete is None:
+        responses = await query_models_parallel(council_models, messages)
+    else:
+        # Fan out per-model so the callback fires the moment each arrives
+        async def query_and_notify(model: str):
+            response = await query_model(model, messages)
+            await on_model_complete(model, response)
+            return response
+
+        results = await asyncio.gather(
+            *(query_and_notify(model) for model in council_models)
+        )
+        responses = {model: response for model, response in zip(council_models, results)}
 
     # Format results
     stage1_results = []
@@ -32,9 +85,11 @@ async def stage1_collect_responses(user_query: str) -> List[Dict[str, Any]]:
     return stage1_results
 
 
+@_council_stage(2)
 async def stage2_collect_rankings(
     user_query: str,
-    stage1_results: List[Dict[str, Any]]
+    stage1_results: List[Dict[str, Any]],
+    council_models: List[str] = COUNCIL_MODELS
 ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
     """
     Stage 2: Each model ranks the anonymized responses.
@@ -42,6 +97,7 @@ async def stage2_collect_rankings(
     Args:
         user_query: The original user query
         stage1_results: Results from Stage 1
+        council_models: OpenRouter model identifiers to use as rankers
 
     Returns:
         Tuple of (rankings list, label_to_model mapping)
@@ -94,8 +150,10 @@ Now provide your evaluation and ranking:"""
 
     messages = [{"role": "user", "content": ranking_prompt}]
 
-    # Get rankings from all council models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
+    # Get rankings from all council models in parallel. Each ranker sees
+    # every anonymized response in a single prompt, so Stage 2 costs one
+    # request per ranker rather than one per (ranker, response) pair.
+    responses = await query_models_parallel(council_models, messages)
 
     # Format results
     stage2_results = []
@@ -112,10 +170,12 @@ Now provide your evaluation and ranking:"""
     return stage2_results, label_to_model
 
 
+@_council_stage(3)
 async def stage3_synthesize_final(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
-    stage2_results: List[Dict[str, Any]]
+    stage2_results: List[Dict[str, Any]],
+    chairman_model: str = CHAIRMAN_MODEL
 ) -> Dict[str, Any]:
     """
     Stage 3: Chairman synthesizes final response.
@@ -124,6 +184,7 @@ async def stage3_synthesize_final(
         user_query: The original user query
         stage1_results: Individual model responses from Stage 1
         stage2_results: Rankings from Stage 2
+        chairman_model: OpenRouter model identifier for the chairman
 
     Returns:
         Dict with 'model' and 'response' keys
@@ -159,17 +220,17 @@ Provide a clear, well-reasoned final answer that represents the council's collec
     messages = [{"role": "user", "content": chairman_prompt}]
 
     # Query the chairman model
-    response = await query_model(CHAIRMAN_MODEL, messages)
+    response = await query_model(chairman_model, messages)
 
     if response is None:
         # Fallback if chairman fails
         return {
-            "model": CHAIRMAN_MODEL,
+            "model": chairman_model,
             "response": "Error: Unable to generate final synthesis."
         }
 
     return {
-        "model": CHAIRMAN_MODEL,
+        "model": chairman_model,
         "response": response.get('content', '')
     }
 
@@ -255,16 +316,31 @@ def calculate_aggregate_rankings(
     return aggregate
 
 
-async def generate_conversation_title(user_query: str) -> str:
+# Bounded memo of generated titles keyed by question hash. Titles are a
+# pure function of the question, so a repeat question reuses its title
+# without another API round-trip.
+_title_cache: Dict[str, str] = {}
+_TITLE_CACHE_MAX = 1024
+
+
+async def generate_conversation_title(
+    user_query: str,
+    model: str = "google/gemini-2.5-flash"
+) -> str:
     """
     Generate a short title for a conversation based on the first user message.
 
     Args:
         user_query: The first user message
+        model: OpenRouter model identifier for title generation
 
     Returns:
         A short title (3-5 words)
     """
+    q_key = hashlib.sha256(user_query.encode()).hexdigest()
+    if q_key in _title_cache:
+        return _title_cache[q_key]
+
     title_prompt = f"""Generate a very short title (3-5 words maximum) that summarizes the following question.
 The title should be concise and descriptive. Do not use quotes or punctuation in the title.
 
@@ -274,8 +350,8 @@ Title:"""
 
     messages = [{"role": "user", "content": title_prompt}]
 
-    # Use gemini-2.5-flash for title generation (fast and cheap)
-    response = await query_model("google/gemini-2.5-flash", messages, timeout=30.0)
+    # Default model is gemini-2.5-flash (fast and cheap)
+    response = await query_model(model, messages, timeout=30.0)
 
     if response is None:
         # Fallback to a generic title
@@ -290,21 +366,33 @@ Title:"""
     if len(title) > 50:
         title = title[:47] + "..."
 
+    # Cache the title, evicting the oldest entry once full (don't cache
+    # the fallback above, so failures get retried)
+    if len(_title_cache) >= _TITLE_CACHE_MAX:
+        _title_cache.pop(next(iter(_title_cache)))
+    _title_cache[q_key] = title
+
     return title
 
 
-async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
+async def run_full_council(
+    user_query: str,
+    council_models: List[str] = COUNCIL_MODELS,
+    chairman_model: str = CHAIRMAN_MODEL
+) -> Tuple[List, List, Dict, Dict]:
     """
     Run the complete 3-stage council process.
 
     Args:
         user_query: The user's question
+        council_models: OpenRouter model identifiers for council members
+        chairman_model: OpenRouter model identifier for the chairman
 
     Returns:
         Tuple of (stage1_results, stage2_results, stage3_result, metadata)
     """
     # Stage 1: Collect individual responses
-    stage1_results = await stage1_collect_responses(user_query)
+    stage1_results = await stage1_collect_responses(user_query, council_models=council_models)
 
     # If no models responded successfully, return error
     if not stage1_results:
@@ -314,7 +402,9 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
         }, {}
 
     # Stage 2: Collect rankings
-    stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results)
+    stage2_results, label_to_model = await stage2_collect_rankings(
+        user_query, stage1_results, council_models=council_models
+    )
 
     # Calculate aggregate rankings
     aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
@@ -323,7 +413,8 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
     stage3_result = await stage3_synthesize_final(
         user_query,
         stage1_results,
-        stage2_results
+        stage2_results,
+        chairman_model=chairman_model
     )
 
     # Prepare metadata
@@ -0,0 +1,34 @@
+"""Shared httpx client with connection pooling for outbound API requests."""
+
+import httpx
+from typing import Optional
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient, creating it lazily on first use.
+
+    A single council_query issues 9+ API requests; reusing one client
+    keeps TCP+TLS connections alive across all of them instead of paying
+    a fresh handshake (~100-300ms) per request.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+
+    return _client
+
+
+async def close_client():
+    """Close the shared client. Call this at server shutdown."""
+    global _client
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+
+    _client = None
@@ -2,17 +2,28 @@
 
 import asyncio
 import json
+import os
+import secrets
 import traceback
-import uuid
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent, LoggingLevel
 
+# orjson serializes 3-10x faster than stdlib json; fall back silently
+# if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from . import cache
+from . import http_client
+from . import semantic_cache
 from . import storage
-from . import config as backend_config
 from .council import (
+    CouncilError,
     stage1_collect_responses,
     stage2_collect_rankings,
     stage3_synthesize_final,
@@ -25,134 +36,246 @@ from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
 # Initialize the MCP server
 server = Server("llm-council")
 
+# Extra progress notifications (per-model arrivals, stage-start echoes)
+# are only emitted when debug logging is enabled; each one is a
+# serialized MCP notification across stdio
+DEBUG_LOGS = os.getenv("LLM_COUNCIL_DEBUG") == "1"
+
+
+async def _log_stage(event: dict):
+    """Send one structured progress notification; never fail the caller."""
+    try:
+        await server.request_context.session.send_log_message(
+            level=LoggingLevel.INFO,
+            data=_dumps(event),
+        )
+    except Exception:
+        pass
+
+
+def _dumps(obj, pretty: bool = False) -> str:
+    """Serialize to JSON, compact by default to keep payloads small."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _chunked_contents(response: dict, chunk_fields: tuple, pretty: bool = False) -> list[TextContent]:
+    """
+    Split a response dict into one TextContent per large field, plus a
+    final chunk carrying the remaining summary fields. Clients can render
+    each chunk as it arrives instead of buffering one giant blob.
+    """
+    contents = [
+        TextContent(type="text", text=_dumps({field: response[field]}, pretty))
+        for field in chunk_fields
+        if field in response
+    ]
+
+    summary = {key: value for key, value in response.items() if key not in chunk_fields}
+    if summary:
+        contents.append(TextContent(type="text", text=_dumps(summary, pretty)))
+
+    return contents
+
+
+# URI prefix for conversation resources; the length constant lets the
+# read handler strip it with a slice instead of a scan-and-replace
+_PREFIX = "council://conversations/"
+_PLEN = len(_PREFIX)
+
+# Static tails of the user-facing error messages, built once so the
+# error paths only interpolate the dynamic parts
+_API_ERROR_HELP = (
+    "\n\nPlease check:\n"
+    "1. Your OPENROUTER_API_KEY is valid\n"
+    "2. You have credits in your OpenRouter account\n"
+    "3. The model names are correct"
+)
+_STAGE1_ERROR_HELP = (
+    "\n\nThis is likely a configuration or API issue. The core council logic works (verified), so check:\n"
+    "1. Your mcp.json config has correct paths\n"
+    "2. OPENROUTER_API_KEY is set in env\n"
+    "3. Model names are valid"
+)
+
+# Cached (storage version, value) pairs for the list endpoints. Clients
+# hit these on every connect/refresh, so rebuild only when storage changed.
+_resources_cache = None
+_conversations_cache = None
+
 
 @server.list_resources()
 async def handle_list_resources() -> list[Resource]:
     """List all available conversation resources."""
+    global _resources_cache
+
+    version = storage.get_version()
+    if _resources_cache is not None and _resources_cache[0] == version:
+        return _resources_cache[1]
+
     conversations = storage.list_conversations()
 
     resources = []
     for conv in conversations:
         resources.append(
             Resource(
-                uri=f"council://conversations/{conv['id']}",
+                uri=_PREFIX + conv['id'],
                 name=f"{conv['title']} ({conv['message_count']} messages)",
                 description=f"Council conversation created at {conv['created_at']}",
                 mimeType="application/json",
             )
         )
 
+    _resources_cache = (version, resources)
+
     return resources
 
 
 @server.read_resource()
 async def handle_read_resource(uri: str) -> str:
     """Read a specific conversation resource."""
-    if not uri.startswith("council://conversations/"):
+    if not uri.startswith(_PREFIX):
         raise ValueError(f"Unknown resource URI: {uri}")
 
-    conversation_id = uri.replace("council://conversations/", "")
-    conversation = storage.get_conversation(conversation_id)
+    conversation_id = uri[_PLEN:]
 
-    if conversation is None:
-        raise ValueError(f"Conversation not found: {conversation_id}")
-
-    return json.dumps(conversation, indent=2)
+    # Serve the stored JSON verbatim; no need to parse and re-serialize
+    raw = storage.get_conversation_raw_json(conversation_id)
 
+    if raw is None:
+        raise ValueError(f"Conversation not found: {conversation_id}")
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List all available council tools."""
-    return [
-        Tool(
-            name="council_query",
-            description=(
-                "Run a full 3-stage LLM Council deliberation on a question. "
-                "Stage 1: Multiple models provide individual responses. "
-                "Stage 2: Models rank each other's responses (anonymized). "
-                "Stage 3: Chairman synthesizes final answer from all input. "
-                "This process takes 30-120 seconds to complete."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "question": {
-                        "type": "string",
-                        "description": "The question to ask the LLM Council",
-                    },
-                    "council_models": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": (
-                            "Optional: List of OpenRouter model identifiers for council members. "
-                            f"Defaults to: {COUNCIL_MODELS}"
-                        ),
-                    },
-                    "chairman_model": {
-                        "type": "string",
-                        "description": (
-                            "Optional: OpenRouter model identifier for the chairman. "
-                            f"Defaults to: {CHAIRMAN_MODEL}"
-                        ),
-                    },
-                    "save_conversation": {
-                        "type": "boolean",
-                        "description": "Whether to save this as a new conversation (default: true)",
-                        "default": True,
-                    },
-                },
-                "required": ["question"],
-            },
+    return raw
+
+
+# Tool definitions are immutable between process restarts (model defaults
+# are frozen at import time, matching runtime reality), so build them once
+# instead of on every list_tools request
+_TOOLS: list[Tool] = [
+    Tool(
+        name="council_query",
+        description=(
+            "Run a full 3-stage LLM Council deliberation on a question. "
+            "Stage 1: Multiple models provide individual responses. "
+            "Stage 2: Models rank each other's responses (anonymized). "
+            "Stage 3: Chairman synthesizes final answer from all input. "
+            "This process takes 30-120 seconds to complete."
         ),
-        Tool(
-            name="council_stage1",
-            description=(
-                "Run only Stage 1 of council deliberation: collect individual responses "
-                "from all council models in parallel. Use this for quick comparison of "
-                "model outputs without the full ranking and synthesis process."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "question": {
-                        "type": "string",
-                        "description": "The question to ask the council models",
-                    },
-                    "council_models": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": (
-                            "Optional: List of OpenRouter model identifiers. "
-                            f"Defaults to: {COUNCIL_MODELS}"
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question": {
+                    "type": "string",
+                    "description": "The question to ask the LLM Council",
+                },
+                "council_models": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Optional: List of OpenRouter model identifiers for council members. "
+                        f"Defaults to: {COUNCIL_MODELS}"
+                    ),
+                },
+                "chairman_model": {
+                    "type": "string",
+                    "description": (
+                        "Optional: OpenRouter model identifier for the chairman. "
+                        f"Defaults to: {CHAIRMAN_MODEL}"
+                    ),
+                },
+                "save_conversation": {
+                    "type": "boolean",
+                    "description": "Whether to save this as a new conversation (default: true)",
+                    "default": True,
+                },
+                "bypass_cache": {
+                    "type": "boolean",
+                    "description": "Whether to skip the response cache and force fresh API calls (default: false)",
+                    "default": False,
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Whether to indent the JSON output for human reading (default: false)",
+                    "default": False,
                 },
-                "required": ["question"],
             },
+            "required": ["question"],
+        },
+    ),
+    Tool(
+        name="council_stage1",
+        description=(
+            "Run only Stage 1 of council deliberation: collect individual responses "
+            "from all council models in parallel. Use this for quick comparison of "
+            "model outputs without the full ranking and synthesis process."
         ),
-        Tool(
-            name="council_list_conversations",
-            description="List all saved council conversations with metadata",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question": {
+                    "type": "string",
+                    "description": "The question to ask the council models",
+                },
+                "council_models": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Optional: List of OpenRouter model identifiers. "
+                        f"Defaults to: {COUNCIL_MODELS}"
+                    ),
+                },
+                "bypass_cache": {
+                    "type": "boolean",
+                    "description": "Whether to skip the response cache and force fresh API calls (default: false)",
+                    "default": False,
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Whether to indent the JSON output for human reading (default: false)",
+                    "default": False,
+                },
             },
-        ),
-        Tool(
-            name="council_get_conversation",
-            description="Retrieve a specific conversation by ID with all messages and stages",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "conversation_id": {
-                        "type": "string",
-                        "description": "The conversation ID to retrieve",
-                    },
+            "required": ["question"],
+        },
+    ),
+    Tool(
+        name="council_list_conversations",
+        description="List all saved council conversations with metadata",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="council_get_conversation",
+        description="Retrieve a specific conversation by ID with all messages and stages",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "conversation_id": {
+                    "type": "string",
+                    "description": "The conversation ID to retrieve",
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Whether to indent the JSON output for human reading (default: false)",
+                    "default": False,
                 },
-                "required": ["conversation_id"],
             },
-        ),
-    ]
+            "required": ["conversation_id"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List all available council tools."""
+    return _TOOLS
 
 
 @server.call_tool()
@@ -171,40 +294,81 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         raise ValueError(f"Unknown tool: {name}")
 
 
+async def _council_query_error(error_msg: str) -> list[TextContent]:
+    """
+    Log a council_query failure and build its error response. The full
+    traceback is only formatted and returned when debug logging is on.
+    """
+    error_details = traceback.format_exc() if DEBUG_LOGS else ""
+
+    await server.request_context.session.send_log_message(
+        level=LoggingLevel.ERROR,
+        data=f"{error_msg}\n\nTraceback:\n{error_details}" if error_details else error_msg,
+    )
+
+    detail = f"\n\nFull details:\n{error_details}" if error_details else ""
+    return [
+        TextContent(
+            type="text",
+            text=error_msg + detail + _API_ERROR_HELP,
+        )
+    ]
+
+
 async def handle_council_query(arguments: dict) -> list[TextContent]:
     """Execute a full 3-stage council deliberation."""
     question = arguments["question"]
-    council_models = arguments.get("council_models", COUNCIL_MODELS)
+    # Normalize to a fresh list so callers can pass any sequence and the
+    # module-level default is never shared mutably
+    council_models = list(arguments.get("council_models", COUNCIL_MODELS))
     chairman_model = arguments.get("chairman_model", CHAIRMAN_MODEL)
     save_conversation = arguments.get("save_conversation", True)
-
-    # Override config temporarily if custom models specified
-    original_council = backend_config.COUNCIL_MODELS
-    original_chairman = backend_config.CHAIRMAN_MODEL
+    bypass_cache = arguments.get("bypass_cache", False)
+    pretty = arguments.get("pretty", False)
+
+    # Check the response cache before doing any API work
+    key = cache.cache_key(question, council_models, chairman_model)
+    if not bypass_cache:
+        cached = cache.get_cached_response(key)
+        cache_hit_type = "exact" if cached is not None else "miss"
+
+        if cached is None:
+            # Fall back to a semantically similar cached question
+            similar_key = await semantic_cache.lookup(question)
+            if similar_key is not None:
+                cached = cache.get_cached_response(similar_key)
+                if cached is not None:
+                    cache_hit_type = "semantic"
+
+        if cached is not None:
+            cached.setdefault("metadata", {})["cache_hit_type"] = cache_hit_type
+            return _chunked_contents(
+                cached,
+                ("stage1_responses", "stage2_rankings", "stage3_synthesis"),
+                pretty,
+            )
 
     try:
-        if council_models != COUNCIL_MODELS:
-            backend_config.COUNCIL_MODELS = council_models
-        if chairman_model != CHAIRMAN_MODEL:
-            backend_config.CHAIRMAN_MODEL = chairman_model
-
-        # Send progress notifications
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.INFO,
-            data="Stage 1: Collecting individual responses from council models...",
-        )
-
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.INFO,
-            data=f"Using models: {council_models}",
-        )
+        # Start title generation in parallel with Stage 1 (don't await yet)
+        title_task = None
+        if save_conversation:
+            title_task = asyncio.create_task(generate_conversation_title(question))
+
+        # In debug mode, stream a progress event as each model arrives
+        on_model_complete = None
+        if DEBUG_LOGS:
+            async def on_model_complete(model: str, response):
+                await _log_stage({
+                    "stage": 1,
+                    "model": model,
+                    "ok": response is not None,
+                })
 
         # Run Stage 1
-        stage1_results = await stage1_collect_responses(question)
-
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.INFO,
-            data=f"Stage 1 returned {len(stage1_results) if stage1_results else 0} results",
+        stage1_results = await stage1_collect_responses(
+            question,
+            on_model_complete=on_model_complete,
+            council_models=council_models,
         )
 
         if not stage1_results:
@@ -215,58 +379,58 @@ async def handle_council_query(arguments: dict) -> list[TextContent]:
                 )
             ]
 
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.INFO,
-            data=f"Stage 1 complete: {len(stage1_results)} responses collected",
-        )
-
-        # Send progress for Stage 2
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.INFO,
-            data="Stage 2: Collecting peer rankings (anonymized)...",
-        )
+        # Stream the full Stage 1 payload so clients can render it
+        # while Stages 2 and 3 are still running
+        await _log_stage({
+            "stage": 1,
+            "status": "complete",
+            "models": council_models,
+            "responses": stage1_results,
+        })
 
         # Run Stage 2
-        stage2_results, label_to_model = await stage2_collect_rankings(question, stage1_results)
-        aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.INFO,
-            data="Stage 2 complete: Peer rankings collected",
+        stage2_results, label_to_model = await stage2_collect_rankings(
+            question, stage1_results, council_models=council_models
         )
+        aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
 
-        # Send progress for Stage 3
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.INFO,
-            data="Stage 3: Chairman synthesizing final answer...",
-        )
+        # Stream the Stage 2 payload before synthesis starts
+        await _log_stage({
+            "stage": 2,
+            "status": "complete",
+            "rankings": stage2_results,
+            "aggregate_rankings": aggregate_rankings,
+        })
 
         # Run Stage 3
         stage3_result = await stage3_synthesize_final(
             question,
             stage1_results,
-            stage2_results
+            stage2_results,
+            chairman_model=chairman_model
         )
 
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.INFO,
-            data="Stage 3 complete: Final synthesis ready",
-        )
+        await _log_stage({"stage": 3, "status": "complete"})
 
         # Prepare metadata
         metadata = {
             "label_to_model": label_to_model,
             "aggregate_rankings": aggregate_rankings,
+            "cache_hit_type": "miss",
         }
 
         # Save conversation if requested
         conversation_id = None
         if save_conversation:
-            conversation_id = str(uuid.uuid4())
+            conversation_id = secrets.token_hex(8)
             storage.create_conversation(conversation_id)
 
-            # Generate title (don't wait for it, do it async)
-            title = await generate_conversation_title(question)
+            # Collect the title that was generated alongside Stage 1
+            try:
+                title = await title_task
+            except Exception:
+                # A title failure shouldn't poison the main response
+                title = "New Conversation"
             storage.update_conversation_title(conversation_id, title)
 
             # Add messages
@@ -289,59 +453,47 @@ async def handle_council_query(arguments: dict) -> list[TextContent]:
 
         if conversation_id:
             response["conversation_id"] = conversation_id
-            response["resource_uri"] = f"council://conversations/{conversation_id}"
+            response["resource_uri"] = _PREFIX + conversation_id
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(response, indent=2),
-            )
-        ]
+        # Cache the full response for repeat questions, and index the
+        # question embedding so paraphrases can find it too
+        cache.set_cached_response(key, response)
+        await semantic_cache.register(question, key)
 
-    except Exception as e:
-        # Log the error with full traceback
-        error_details = traceback.format_exc()
-
-        await server.request_context.session.send_log_message(
-            level=LoggingLevel.ERROR,
-            data=f"Error in council_query: {str(e)}\n\nTraceback:\n{error_details}",
+        return _chunked_contents(
+            response,
+            ("stage1_responses", "stage2_rankings", "stage3_synthesis"),
+            pretty,
         )
-        # Return error to user
-        return [
-            TextContent(
-                type="text",
-                text=f"Error: {str(e)}\n\nFull details:\n{error_details}\n\nPlease check:\n1. Your OPENROUTER_API_KEY is valid\n2. You have credits in your OpenRouter account\n3. The model names are correct",
-            )
-        ]
 
-    finally:
-        # Restore original config
-        backend_config.COUNCIL_MODELS = original_council
-        backend_config.CHAIRMAN_MODEL = original_chairman
+    except CouncilError as e:
+        return await _council_query_error(f"Error in stage {e.stage}: {e.cause}")
+
+    except Exception as e:
+        return await _council_query_error(f"Error: {e}")
 
 
 async def handle_council_stage1(arguments: dict) -> list[TextContent]:
     """Execute only Stage 1: collect individual responses."""
     question = arguments["question"]
-    council_models = arguments.get("council_models", COUNCIL_MODELS)
-
-    # Override config temporarily if custom models specified
-    original_council = backend_config.COUNCIL_MODELS
+    # Normalize to a fresh list so callers can pass any sequence and the
+    # module-level default is never shared mutably
+    council_models = list(arguments.get("council_models", COUNCIL_MODELS))
+    bypass_cache = arguments.get("bypass_cache", False)
+    pretty = arguments.get("pretty", False)
+
+    # Check the response cache before doing any API work
+    key = cache.cache_key(question, council_models, namespace="council_stage1")
+    if not bypass_cache:
+        cached = cache.get_cached_response(key)
+        if cached is not None:
+            return _chunked_contents(cached, ("responses",), pretty)
 
     try:
-        if council_models != COUNCIL_MODELS:
-            backend_config.COUNCIL_MODELS = council_models
-
-        # Optional: try to log, but don't fail if it doesn't work
-        try:
-            await server.request_context.session.send_log_message(
-                level=LoggingLevel.INFO,
-                data=f"Collecting responses from {len(council_models)} models...",
-            )
-        except Exception:
-            pass
+        if DEBUG_LOGS:
+            await _log_stage({"stage": 1, "status": "started", "models": council_models})
 
-        stage1_results = await stage1_collect_responses(question)
+        stage1_results = await stage1_collect_responses(question, council_models=council_models)
 
         if not stage1_results:
             return [
@@ -358,51 +510,79 @@ async def handle_council_stage1(arguments: dict) -> list[TextContent]:
             "responses_received": len(stage1_results),
         }
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(response, indent=2),
-            )
-        ]
+        # Cache the response for repeat questions
+        cache.set_cached_response(key, response)
+
+        return _chunked_contents(response, ("responses",), pretty)
+
+    except CouncilError as e:
+        error_msg = f"Error in stage {e.stage}: {e.cause}"
+        return await _council_stage1_error(error_msg)
 
     except Exception as e:
-        # Try to log, but don't fail if logging fails
         error_msg = f"Error in council_stage1: {str(e)}"
-        try:
-            error_details = traceback.format_exc()
-            await server.request_context.session.send_log_message(
-                level=LoggingLevel.ERROR,
-                data=f"{error_msg}\n\nTraceback:\n{error_details}",
-            )
-        except Exception:
-            pass  # Logging failed, but we'll still return the error
+        return await _council_stage1_error(error_msg)
 
-        return [
-            TextContent(
-                type="text",
-                text=f"{error_msg}\n\nThis is likely a configuration or API issue. The core council logic works (verified), so check:\n1. Your mcp.json config has correct paths\n2. OPENROUTER_API_KEY is set in env\n3. Model names are valid",
-            )
-        ]
 
-    finally:
-        backend_config.COUNCIL_MODELS = original_council
+async def _council_stage1_error(error_msg: str) -> list[TextContent]:
+    """Log a council_stage1 failure and build its error response."""
+    # Try to log, but don't fail if logging fails
+    try:
+        error_details = traceback.format_exc() if DEBUG_LOGS else ""
+        await server.request_context.session.send_log_message(
+            level=LoggingLevel.ERROR,
+            data=f"{error_msg}\n\nTraceback:\n{error_details}" if error_details else error_msg,
+        )
+    except Exception:
+        pass  # Logging failed, but we'll still return the error
+
+    return [
+        TextContent(
+            type="text",
+            text=error_msg + _STAGE1_ERROR_HELP,
+        )
+    ]
 
 
 async def handle_list_conversations_tool() -> list[TextContent]:
     """List all conversations."""
+    global _conversations_cache
+
+    version = storage.get_version()
+    if _conversations_cache is not None and _conversations_cache[0] == version:
+        return _conversations_cache[1]
+
     conversations = storage.list_conversations()
 
-    return [
+    contents = [
         TextContent(
             type="text",
-            text=json.dumps(conversations, indent=2),
+            text=_dumps(conversations),
         )
     ]
 
+    _conversations_cache = (version, contents)
+
+    return contents
+
 
 async def handle_get_conversation_tool(arguments: dict) -> list[TextContent]:
     """Get a specific conversation."""
     conversation_id = arguments["conversation_id"]
+    pretty = arguments.get("pretty", False)
+
+    # Serve the stored JSON verbatim when the caller doesn't care about
+    # formatting; only parse and re-dump for explicit pretty output
+    if not pretty:
+        raw = storage.get_conversation_raw_json(conversation_id)
+        if raw is not None:
+            return [
+                TextContent(
+                    type="text",
+                    text=raw,
+                )
+            ]
+
     conversation = storage.get_conversation(conversation_id)
 
     if conversation is None:
@@ -416,26 +596,34 @@ async def handle_get_conversation_tool(arguments: dict) -> list[TextContent]:
     return [
         TextContent(
             type="text",
-            text=json.dumps(conversation, indent=2),
+            text=_dumps(conversation, pretty),
         )
     ]
 
 
+# Initialization options are likewise static; build them once
+_INIT_OPTIONS = InitializationOptions(
+    server_name="llm-council",
+    server_version="0.1.0",
+    capabilities=server.get_capabilities(
+        notification_options=NotificationOptions(),
+        experimental_capabilities={},
+    ),
+)
+
+
 async def async_main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="llm-council",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            ),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                _INIT_OPTIONS,
+            )
+    finally:
+        # Release the pooled HTTP connections on shutdown
+        await http_client.close_client()
 
 
 def main():
@@ -1,8 +1,9 @@
 """OpenRouter API client for making LLM requests."""
 
-import httpx
 from typing import List, Dict, Any, Optional
 from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+from .http_client import get_client
+from .throttle import throttled
 
 
 async def query_model(
@@ -32,11 +33,12 @@ async def query_model(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
+        async with throttled():
+            response = await get_client().post(
                 OPENROUTER_API_URL,
                 headers=headers,
-                json=payload
+                json=payload,
+                timeout=timeout
             )
             response.raise_for_status()
 
@@ -0,0 +1,170 @@
+"""Embedding-based semantic cache layer for near-duplicate questions."""
+
+import json
+import os
+from typing import List, Optional
+
+from .cache import CACHE_DIR
+from .config import OPENROUTER_API_KEY
+from .http_client import get_client
+from .throttle import throttled
+
+# numpy is optional - without it the semantic layer is disabled and
+# lookups fall through to the exact cache
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Embeddings endpoint and model (cheap and fast)
+EMBEDDINGS_API_URL = os.getenv(
+    "LLM_COUNCIL_EMBEDDINGS_URL",
+    "https://openrouter.ai/api/v1/embeddings"
+)
+EMBEDDING_MODEL = os.getenv(
+    "LLM_COUNCIL_EMBEDDING_MODEL",
+    "openai/text-embedding-3-small"
+)
+
+# Minimum cosine similarity for a semantic cache hit
+SIMILARITY_THRESHOLD = float(os.getenv("LLM_COUNCIL_SIMILARITY_THRESHOLD", "0.92"))
+
+# Index files: embedding matrix plus sidecar list of cache keys
+EMBEDDINGS_PATH = CACHE_DIR / "embeddings.npy"
+IDS_PATH = CACHE_DIR / "embedding_ids.json"
+
+
+async def embed_text(text: str) -> Optional[List[float]]:
+    """
+    Embed a text via the embeddings API.
+
+    Args:
+        text: The text to embed
+
+    Returns:
+        Embedding vector, or None if the request failed
+    """
+    headers = {
+        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Content-Type": "application/json",
+    }
+
+    payload = {
+        "model": EMBEDDING_MODEL,
+        "input": text,
+    }
+
+    try:
+        async with throttled():
+            response = await get_client().post(
+                EMBEDDINGS_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=30.0
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            return data['data'][0]['embedding']
+
+    except Exception as e:
+        print(f"Error embedding text: {e}")
+        return None
+
+
+def _load_index():
+    """Load the embedding matrix and cache key list, or (None, []) if empty."""
+    if not EMBEDDINGS_PATH.exists() or not IDS_PATH.exists():
+        return None, []
+
+    try:
+        matrix = np.load(EMBEDDINGS_PATH)
+        with open(IDS_PATH, 'r') as f:
+            ids = json.load(f)
+    except (OSError, ValueError, json.JSONDecodeError):
+        return None, []
+
+    if matrix.shape[0] != len(ids):
+        # Index files are out of sync; start over
+        return None, []
+
+    return matrix, ids
+
+
+async def lookup(question: str) -> Optional[str]:
+    """
+    Find the cache key of the nearest cached question above the threshold.
+
+    Args:
+        question: The incoming question
+
+    Returns:
+        Cache key of a semantically similar question, or None on miss
+    """
+    if np is None:
+        return None
+
+    matrix, ids = _load_index()
+    if matrix is None:
+        return None
+
+    vec = await embed_text(question)
+    if vec is None:
+        return None
+
+    query = np.asarray(vec, dtype=np.float32)
+
+    if matrix.shape[1] != query.shape[0]:
+        # The embedding model changed since the index was built; treat
+        # the stale index as empty rather than failing the query
+        return None
+
+    # Cosine similarity against all rows in one vectorized pass
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    norms[norms == 0] = 1.0  # Avoid division by zero
+    similarities = matrix @ query / norms
+
+    best = int(np.argmax(similarities))
+    if similarities[best] >= SIMILARITY_THRESHOLD:
+        return ids[best]
+
+    return None
+
+
+async def register(question: str, key: str):
+    """
+    Add a question's embedding to the index, pointing at its cache key.
+
+    Indexing is an optimization: like a failed embedding call, a failed
+    index write is silently dropped rather than failing the caller.
+
+    Args:
+        question: The question that was answered
+        key: Exact-cache key where the response is stored
+    """
+    if np is None:
+        return
+
+    vec = await embed_text(question)
+    if vec is None:
+        return
+
+    row = np.asarray([vec], dtype=np.float32)
+
+    matrix, ids = _load_index()
+    if matrix is None or matrix.shape[1] != row.shape[1]:
+        # No index yet, or the embedding model changed and the stored
+        # vectors are incompatible; start a fresh index
+        matrix = row
+        ids = [key]
+    else:
+        matrix = np.vstack([matrix, row])
+        ids.append(key)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.save(EMBEDDINGS_PATH, matrix)
+        with open(IDS_PATH, 'w') as f:
+            json.dump(ids, f)
+    except OSError:
+        pass
@@ -8,6 +8,23 @@ from pathlib import Path
 from .config import DATA_DIR
 
 
+# Monotonic version counter, bumped on every write. Callers can cache
+# derived views (e.g. conversation listings) and invalidate by comparing
+# against get_version() instead of re-reading storage.
+_version = 0
+
+
+def get_version() -> int:
+    """Return the current storage version (bumped on every write)."""
+    return _version
+
+
+def _bump_version():
+    """Record that storage has changed."""
+    global _version
+    _version += 1
+
+
 def ensure_data_dir():
     """Ensure the data directory exists."""
     Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
@@ -42,6 +59,8 @@ def create_conversation(conversation_id: str) -> Dict[str, Any]:
     with open(path, 'w') as f:
         json.dump(conversation, f, indent=2)
 
+    _bump_version()
+
     return conversation
 
 
@@ -64,6 +83,28 @@ def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
         return json.load(f)
 
 
+def get_conversation_raw_json(conversation_id: str) -> Optional[str]:
+    """
+    Read a conversation's JSON straight from disk without parsing.
+
+    Callers that only re-serialize the conversation (e.g. to hand it to
+    a client verbatim) can skip the parse + re-dump round-trip.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        Raw JSON string as stored, or None if not found
+    """
+    path = get_conversation_path(conversation_id)
+
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r') as f:
+        return f.read()
+
+
 def save_conversation(conversation: Dict[str, Any]):
     """
     Save a conversation to storage.
@@ -77,6 +118,8 @@ def save_conversation(conversation: Dict[str, Any]):
     with open(path, 'w') as f:
         json.dump(conversation, f, indent=2)
 
+    _bump_version()
+
 
 def list_conversations() -> List[Dict[str, Any]]:
     """
@@ -0,0 +1,78 @@
+"""Concurrency cap and rate limiting for OpenRouter requests."""
+
+import asyncio
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+
+# Maximum number of concurrent OpenRouter requests
+MAX_CONCURRENCY = int(os.getenv("LLM_COUNCIL_MAX_CONCURRENCY", "10"))
+
+# Requests per minute allowed against the provider
+REQUESTS_PER_MINUTE = int(os.getenv("LLM_COUNCIL_REQUESTS_PER_MINUTE", "60"))
+
+SEM = asyncio.Semaphore(MAX_CONCURRENCY)
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at a fixed per-second rate.
+
+    Callers await acquire() and sleep until a token is available, so the
+    request rate never exceeds the refill rate over any sustained window.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                elapsed = now - self.updated
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.refill_rate
+
+            await asyncio.sleep(wait)
+
+
+BUCKET = TokenBucket(
+    capacity=REQUESTS_PER_MINUTE,
+    refill_rate=REQUESTS_PER_MINUTE / 60
+)
+
+
+@asynccontextmanager
+async def throttled():
+    """
+    Hold a concurrency slot and a rate-limit token for the duration of
+    one OpenRouter request.
+    """
+    start = time.monotonic()
+
+    async with SEM:
+        await BUCKET.acquire()
+
+        # Surface long waits so operators can tune the limits. This goes
+        # to stderr: under the stdio MCP transport, stdout is the
+        # JSON-RPC channel and must stay clean.
+        waited = time.monotonic() - start
+        if waited > 0.1:
+            print(
+                f"Throttle: waited {waited:.2f}s for an OpenRouter request slot",
+                file=sys.stderr,
+            )
+
+        yield